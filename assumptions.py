@@ -1,9 +1,12 @@
 # assumptions.py
 
+import streamlit as st
+
 # --------------------------------------------------
 # ENGINEERING ASSUMPTIONS – PAD FOUNDATIONS
 # --------------------------------------------------
 
+@st.cache_data
 def get_engineering_assumptions(
     gamma_G: float,
     gamma_Q: float,
@@ -1,10 +1,5 @@
 import streamlit as st
-import math
-
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.pagesizes import A4
-from io import BytesIO
+import numpy as np
 
 from assumptions import get_engineering_assumptions
 
@@ -46,8 +41,16 @@ input_col, calc_col, results_col = st.columns([1, 1.2, 1])
 # SESSION STATE
 # --------------------------------------------------
 
+# Pads stored column-wise (one list per field) so the
+# calculations can take each field as an array directly
 if "pads" not in st.session_state:
-    st.session_state.pads = []
+    st.session_state.pads = {"id": [], "G": [], "Q": [], "Sur_G": [], "Sur_Q": []}
+
+# Results per pad (arrays aligned with pads) and the global
+# inputs they were calculated for
+if "pad_results" not in st.session_state:
+    st.session_state.pad_results = None
+    st.session_state.pad_results_sig = None
 
 # --------------------------------------------------
 # INPUTS (COMMON)
@@ -112,15 +115,12 @@ with input_col:
         )
 
     if st.button("➕ Add pad foundation"):
-        st.session_state.pads.append(
-            {
-                "id": len(st.session_state.pads) + 1,
-                "G": G,
-                "Q": Q,
-                "Sur_G": Sur_G,
-                "Sur_Q": Sur_Q,
-            }
-        )
+        pads = st.session_state.pads
+        pads["id"].append(len(pads["id"]) + 1)
+        pads["G"].append(G)
+        pads["Q"].append(Q)
+        pads["Sur_G"].append(Sur_G)
+        pads["Sur_Q"].append(Sur_Q)
 
     st.divider()
 
@@ -133,166 +133,251 @@ GAMMA_CONC = 24.0  # kN/m³
 gamma_G = 1.0
 gamma_Q = 1.0
 
+# Factored self-weight per B³ with t = B / 2 (γG·γc/2)
+SW_PER_B3 = 0.5 * gamma_G * GAMMA_CONC
+
 DEPTH_STEP = 0.05
 DEPTH_SEARCH_LIMIT = 3.0
 
-B_REFINE_STEP = 0.01  # m (10 mm)
-
 # --------------------------------------------------
 # HELPERS
 # --------------------------------------------------
 
-def round_up(value, inc):
-    return math.ceil(value / inc) * inc
+def round_up_vec(values, inc):
+    return np.ceil(np.asarray(values) / inc) * inc
+
+# Aligned columns for the feasible pads, formatted in C via np.char.mod
+@st.cache_data
+def build_summary_df(pad_ids, B_final, t_round, utilisation, N_ck, volume):
+    import pandas as pd
+
+    return pd.DataFrame(
+        {
+            "Pad ID": pad_ids,
+            "Width (m)": np.char.mod("%.2f", B_final),
+            "Depth (m)": np.char.mod("%.2f", t_round),
+            "Utilisation (%)": np.char.mod("%.1f", utilisation * 100),
+            "SLS Load (kN)": np.char.mod("%.1f", N_ck),
+            "Volume (m³)": np.char.mod("%.2f", volume),
+        }
+    )
+
+# reportlab is only imported when a PDF is actually requested
+def generate_pdf(summary_df):
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.pagesizes import A4
+    from io import BytesIO
+
+    buffer = BytesIO()
+    styles = getSampleStyleSheet()
+
+    story = [
+        Paragraph("Pad Foundation Preliminary Sizing", styles["Title"]),
+        Spacer(1, 12),
+    ]
+
+    for row in summary_df.to_dict("records"):
+        story.append(Paragraph(f"<b>Pad {row['Pad ID']}</b>", styles["Heading3"]))
+        story.append(
+            Paragraph(
+                "  |  ".join(
+                    f"{label}: {value}"
+                    for label, value in row.items()
+                    if label != "Pad ID"
+                ),
+                styles["Normal"],
+            )
+        )
+
+    story.append(Spacer(1, 12))
+    story.append(
+        Paragraph(
+            "Preliminary sizing only. Not a substitute for full EC7 / EC2 design.",
+            styles["Italic"],
+        )
+    )
 
-def round_down(value, inc):
-    return math.floor(value / inc) * inc
+    SimpleDocTemplate(buffer, pagesize=A4).build(story)
+    return buffer.getvalue()
 
 # --------------------------------------------------
 # depth to width B relationship: t = B / 2
+#
+# With t = B / 2 the bearing check q_ed <= q_target becomes
+#   a·B³ - c·B² + N <= 0
+# where a = γG·γc/2, c = q_target - γG·Sur_G - γQ·Sur_Q
+# and N = γG·G + γQ·Q. The check is satisfied between the
+# two positive roots of the cubic, solved here in closed
+# form (trigonometric Cardano).
+# --------------------------------------------------
+def bearing_width_limits(a, c, N):
+
+    # a is a scalar; c and N may be floats or arrays of pads.
+    # Widths with no feasible solution come back as NaN.
+    c = np.asarray(c, dtype=float)
+    N = np.asarray(N, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+
+        # No self-weight: quadratic, single lower limit
+        if a == 0.0:
+            B_lower = np.where(N <= 0.0, 0.0, np.sqrt(N / c))
+            return B_lower, np.full_like(B_lower, np.inf)
+
+        shift = c / (3.0 * a)
+        cos_arg = 1.0 - N / (2.0 * a * shift * shift * shift)
+
+        # cos_arg < -1: self-weight alone exceeds the target
+        # pressure at every width (arccos gives NaN).
+        # cos_arg > 1 only for N <= 0, clipped to B_lower = 0.
+        phi = np.arccos(np.minimum(cos_arg, 1.0))
+
+        B_lower = shift * (1.0 + 2.0 * np.cos((phi - 2.0 * np.pi) / 3.0))
+        B_upper = shift * (1.0 + 2.0 * np.cos(phi / 3.0))
+
+        # One Newton step on f(B) = a·B³ - c·B² + N removes the
+        # rounding error of acos / cos (kept only if it stays
+        # bracketed below the turning point B = 2·shift)
+        f = (a * B_lower - c) * B_lower * B_lower + N
+        df = (3.0 * a * B_lower - 2.0 * c) * B_lower
+        B_newton = B_lower - f / df
+
+        polish = (df < 0.0) & (B_newton > 0.0) & (B_newton < 2.0 * shift)
+        B_lower = np.where(polish, B_newton, B_lower)
+
+    return B_lower, B_upper
+
+
 # --------------------------------------------------
-def solve_pad(
+# Adopted (rounded) geometry and bearing check.
+# Works on arrays of pads; a NaN B_opt (infeasible
+# pad) propagates to the adopted geometry.
+# --------------------------------------------------
+def adopted_pad_results(
+    B_opt,
     G,
     Q,
     Sur_G,
     Sur_Q,
     q_allow,
-    target_utilisation,
-    min_width,
-    min_depth,          # kept for interface consistency
-    rounding,           # kept for interface consistency
+    q_target,
+    rounding,
     include_self_weight,
 ):
 
-    # --------------------------------------------------
-    # Base loads (excluding pad & surcharge)
-    # --------------------------------------------------
-    N_ck_initial = gamma_G * G + gamma_Q * Q
-    q_target = target_utilisation * q_allow
+    # ---- round UP (conservative) ----
+    B_final = round_up_vec(B_opt, rounding)
+    B2 = B_final * B_final
 
-    # --------------------------------------------------
-    # Initial width from bearing only
-    # --------------------------------------------------
-    A_req = N_ck_initial / q_target
-    B = max(math.sqrt(A_req), min_width)
+    # ---- enforce geometry AFTER rounding ----
+    t_round = 0.5 * B_final
 
-    # --------------------------------------------------
-    # Refine width (continuous, no rounding)
-    # Enforce t = B / 2 at ALL times
-    # --------------------------------------------------
-    while True:
-
-        t = 0.5 * B  # ← enforced geometry rule
-
-        # Surcharges
-        N_ck_sur_G = Sur_G * B**2
-        N_ck_sur_Q = Sur_Q * B**2
+    # ---- self-weight ----
+    if include_self_weight:
+        W_pad = B2 * t_round * GAMMA_CONC
+    else:
+        W_pad = np.zeros_like(B_final)
 
-        # Self-weight
-        W_pad = B**2 * t * GAMMA_CONC if include_self_weight else 0.0
+    # ---- surcharge ----
+    N_ck_sur_G = Sur_G * B2
+    N_ck_sur_Q = Sur_Q * B2
 
-        # Final axial load
-        N_ck = (
-            gamma_G * (G + W_pad + N_ck_sur_G)
-            + gamma_Q * (Q + N_ck_sur_Q)
-        )
+    # ---- final axial load ----
+    N_ck_final = (
+        gamma_G * (G + W_pad + N_ck_sur_G)
+        + gamma_Q * (Q + N_ck_sur_Q)
+    )
 
-        # Bearing pressure
-        q_ed = N_ck / B**2
-        util = q_ed / q_allow
+    # ---- bearing pressure ----
+    q_ed = N_ck_final / B2
 
-        if util > target_utilisation:
-            B += B_REFINE_STEP
-        else:
-            break
+    # ---- indicative sizing (np.sqrt, not ** 0.5) ----
+    N_ck_initial = gamma_G * G + gamma_Q * Q
+    A0 = N_ck_initial / q_target
 
-    # --------------------------------------------------
-    # Return continuous (unrounded) solution
-    # --------------------------------------------------
     return {
-        "B_opt": B,
-        "t": t,
+        "B_opt": B_opt,
+        "B_final": B_final,
+        "t_round": t_round,
+        "W_pad": W_pad,
+        "N_ck_sur_G": N_ck_sur_G,
+        "N_ck_sur_Q": N_ck_sur_Q,
+        "N_ck": N_ck_final,
+        "q_ed": q_ed,
+        "utilisation": q_ed / q_allow,
+        "volume": B2 * t_round,
         "N_ck_initial": N_ck_initial,
-        "q_target": q_target,
+        "A0": A0,
+        "B0": np.sqrt(A0),
     }
 
 
 # --------------------------------------------------
-# CALCULATIONS
+# Solve arrays of pads in closed form.
+# Returns arrays of adopted_pad_results, NaN where no
+# feasible size exists. Cached across Streamlit reruns,
+# e.g. when a global input is set back to a previous value.
 # --------------------------------------------------
+@st.cache_data(max_entries=512)
+def solve_pads_batch(
+    G,
+    Q,
+    Sur_G,
+    Sur_Q,
+    q_allow,
+    q_target,
+    min_width,
+    rounding,
+    include_self_weight,
+):
 
-with calc_col:
-    st.header("Pad Foundation Designs")
-
-    for pad in st.session_state.pads:
-
-        st.subheader(f"Pad {pad['id']}")
-
-        result = solve_pad(
-            G=pad["G"],
-            Q=pad["Q"],
-            Sur_G=pad["Sur_G"],
-            Sur_Q=pad["Sur_Q"],
-            q_allow=q_allow,
-            target_utilisation=target_utilisation,
-            min_width=min_width,
-            min_depth=min_depth,
-            rounding=rounding,
-            include_self_weight=include_self_weight,
-        )
+    # --------------------------------------------------
+    # Base loads (excluding pad & surcharge)
+    # --------------------------------------------------
+    N_ck_initial = gamma_G * G + gamma_Q * Q
 
-        if result is None:
-            st.error("No feasible pad size found for this load case.")
-            continue
+    # --------------------------------------------------
+    # Cubic coefficients (continuous, no rounding)
+    # Enforce t = B / 2 at ALL times
+    # --------------------------------------------------
+    a = SW_PER_B3 if include_self_weight else 0.0
+    c = q_target - gamma_G * Sur_G - gamma_Q * Sur_Q
 
-        # ---- continuous optimum ----
-        B_opt = result["B_opt"]
-        t = result["t"]
-        N_ck_initial = result["N_ck_initial"]
-        q_target = result["q_target"]
-
-        # ---- round UP (conservative) ----
-        B_final = round_up(B_opt, rounding)
-        # ---- enforce geometry AFTER rounding ----
-        t_round = 0.5 * B_final
-
-        # ---- self-weight ----
-        W_pad = B_final**2 * t_round * GAMMA_CONC if include_self_weight else 0.0
-
-        # ---- surcharge ----
-        N_ck_sur_G = pad["Sur_G"] * B_final**2
-        N_ck_sur_Q = pad["Sur_Q"] * B_final**2
-        N_ck_surcharge = N_ck_sur_G + N_ck_sur_Q
-
-        # ---- final axial load ----
-        N_ck_final = (
-            gamma_G * (pad["G"] + W_pad + N_ck_sur_G)
-            + gamma_Q * (pad["Q"] + N_ck_sur_Q)
-        )
+    B_lower, B_upper = bearing_width_limits(a, c, N_ck_initial)
 
-        # ---- bearing pressure ----
-        q_ed = N_ck_final / B_final**2
-        utilisation = q_ed / q_allow
+    # Infeasible when the surcharge alone exceeds the target
+    # pressure (c <= 0), the self-weight alone does (NaN), or
+    # the minimum width lies beyond the feasible range
+    feasible = (c > 0.0) & ~np.isnan(B_lower) & (min_width <= B_upper)
 
-        # ---- indicative sizing ----
-        A0 = N_ck_initial / q_target
-        B0 = math.sqrt(A0)
+    B_opt = np.where(feasible, np.maximum(B_lower, min_width), np.nan)
 
-        volume = B_final**2 * t_round
+    # --------------------------------------------------
+    # Return continuous optimum with the adopted design
+    # --------------------------------------------------
+    return adopted_pad_results(
+        B_opt=B_opt,
+        G=G,
+        Q=Q,
+        Sur_G=Sur_G,
+        Sur_Q=Sur_Q,
+        q_allow=q_allow,
+        q_target=q_target,
+        rounding=rounding,
+        include_self_weight=include_self_weight,
+    )
 
 
-        pad["results"] = {
-        "B_final": B_final,
-        "t_round": t_round,
-        "q_ed": q_ed,
-        "utilisation": utilisation,
-        "N_ck": N_ck_final,
-        "volume": volume,
-        "calc_md": f"""
+# --------------------------------------------------
+# CALCULATION STEPS (markdown)
+# Built only when the user asks to see them
+# --------------------------------------------------
+CALC_TEMPLATE = """
 **1. Applied loads contributing to foundation design**  
 
-Column dead load, G = {pad['G']:.1f} kN  
-Column live load, Q = {pad['Q']:.1f} kN  
+Column dead load, G = %(G).1f kN  
+Column live load, Q = %(Q).1f kN  
 
 Surcharge loads act over the full pad area and are calculated once pad size is known.  
 Pad self-weight is included in the design and depends on the adopted pad dimensions.
@@ -301,8 +386,8 @@ Pad self-weight is included in the design and depends on the adopted pad dimensi
 
 **2. Target bearing pressure**  
 
-q_target = {target_utilisation:.2f} × qₐ  
-= {q_target:.1f} kN/m²
+q_target = %(target_utilisation).2f × qₐ  
+= %(q_target).1f kN/m²
 
 ---
 
@@ -313,14 +398,14 @@ A = Nck,base / q_target
 
 Where:  
 Nck,base = γG·G + γQ·Q  
-= {gamma_G:.2f}×{pad['G']:.1f} + {gamma_Q:.2f}×{pad['Q']:.1f}  
-= **{N_ck_initial:.1f} kN**
+= %(gamma_G).2f×%(G).1f + %(gamma_Q).2f×%(Q).1f  
+= **%(N_ck_initial).1f kN**
 
-A = {N_ck_initial:.1f} / {q_target:.1f}  
-**A = {A0:.2f} m²**
+A = %(N_ck_initial).1f / %(q_target).1f  
+**A = %(A0).2f m²**
 
 Indicative pad width:  
-B = √A = {B0:.2f} m  
+B = √A = %(B0).2f m  
 
 ---
 
@@ -329,13 +414,13 @@ B = √A = {B0:.2f} m
 Pad width rounded **upwards** for constructability and conservatism.
 
 Adopted pad width:  
-**B = {B_final:.2f} m**
+**B = %(B_final).2f m**
 
 Pad depth governed by geometric rule:  
 t = B / 2  
 
 Adopted pad depth:  
-**t = {t_round:.2f} m**
+**t = %(t_round).2f m**
 
 ---
 
@@ -344,24 +429,24 @@ Adopted pad depth:
 Pad self-weight calculated from adopted geometry:
 
 W = B² · t · γc  
-= {B_final:.2f}² × {t_round:.2f} × {GAMMA_CONC:.1f}  
+= %(B_final).2f² × %(t_round).2f × %(GAMMA_CONC).1f  
 
-**W = {W_pad:.1f} kN**
+**W = %(W_pad).1f kN**
 
 ---
 
 **6. Surcharge loads acting on pad area**  
 
 Dead load surcharge:  
-Gₛ = {pad['Sur_G']:.2f} × {B_final:.2f}²  
-**Gₛ = {N_ck_sur_G:.1f} kN**
+Gₛ = %(Sur_G).2f × %(B_final).2f²  
+**Gₛ = %(N_ck_sur_G).1f kN**
 
 Live load surcharge:  
-Qₛ = {pad['Sur_Q']:.2f} × {B_final:.2f}²  
-**Qₛ = {N_ck_sur_Q:.1f} kN**
+Qₛ = %(Sur_Q).2f × %(B_final).2f²  
+**Qₛ = %(N_ck_sur_Q).1f kN**
 
 Total surcharge load:  
-**Gₛ + Qₛ = {N_ck_surcharge:.1f} kN**
+**Gₛ + Qₛ = %(N_ck_surcharge).1f kN**
 
 ---
 
@@ -371,36 +456,148 @@ Total design axial load acting on soil beneath pad:
 
 Nck = γG·(G + W + Gₛ) + γQ·(Q + Qₛ)
 
-= {gamma_G:.2f}×({pad['G']:.1f} + {W_pad:.1f} + {N_ck_sur_G:.1f})  
-+ {gamma_Q:.2f}×({pad['Q']:.1f} + {N_ck_sur_Q:.1f})
+= %(gamma_G).2f×(%(G).1f + %(W_pad).1f + %(N_ck_sur_G).1f)  
++ %(gamma_Q).2f×(%(Q).1f + %(N_ck_sur_Q).1f)
 
-**Nck = {N_ck_final:.1f} kN**
+**Nck = %(N_ck).1f kN**
 
 ---
 
 **8. Bearing pressure check**  
 
 q_ed = Nck / B²  
-= {N_ck_final:.1f} / {B_final:.2f}²  
+= %(N_ck).1f / %(B_final).2f²  
 
-**q_ed = {q_ed:.1f} kN/m² ≤ {q_allow:.1f} kN/m²**
+**q_ed = %(q_ed).1f kN/m² ≤ %(q_allow).1f kN/m²**
 
 ✔ Bearing capacity OK
 """
 
-}
 
+def calc_steps_md(pad, res, q_allow, target_utilisation, q_target):
+    return CALC_TEMPLATE % {
+        "G": pad["G"],
+        "Q": pad["Q"],
+        "Sur_G": pad["Sur_G"],
+        "Sur_Q": pad["Sur_Q"],
+        "gamma_G": gamma_G,
+        "gamma_Q": gamma_Q,
+        "GAMMA_CONC": GAMMA_CONC,
+        "q_allow": q_allow,
+        "target_utilisation": target_utilisation,
+        "q_target": q_target,
+        "N_ck_initial": res["N_ck_initial"],
+        "A0": res["A0"],
+        "B0": res["B0"],
+        "B_final": res["B_final"],
+        "t_round": res["t_round"],
+        "W_pad": res["W_pad"],
+        "N_ck_sur_G": res["N_ck_sur_G"],
+        "N_ck_sur_Q": res["N_ck_sur_Q"],
+        "N_ck_surcharge": res["N_ck_sur_G"] + res["N_ck_sur_Q"],
+        "N_ck": res["N_ck"],
+        "q_ed": res["q_ed"],
+    }
+
+
+# --------------------------------------------------
+# CALCULATIONS
+# --------------------------------------------------
+
+with calc_col:
+    st.header("Pad Foundation Designs")
+
+    pads = st.session_state.pads
+    n_pads = len(pads["id"])
+
+    # ---- target bearing pressure (same for every pad) ----
+    q_target = round(target_utilisation * q_allow, 6)
+
+    # --------------------------------------------------
+    # Only solve pads added since the last run, unless a
+    # global input changed (then every pad is re-solved)
+    # --------------------------------------------------
+    global_sig = (
+        q_allow,
+        target_utilisation,
+        min_width,
+        include_self_weight,
+        rounding,
+    )
+
+    results = st.session_state.pad_results
+
+    if results is None or st.session_state.pad_results_sig != global_sig:
+        first_stale = 0
+    else:
+        first_stale = len(results["B_final"])
+
+    # ---- inputs rounded for stable cache keys ----
+    G_arr = np.round(np.asarray(pads["G"][first_stale:], dtype=float), 6)
+    Q_arr = np.round(np.asarray(pads["Q"][first_stale:], dtype=float), 6)
+    Sur_G_arr = np.round(np.asarray(pads["Sur_G"][first_stale:], dtype=float), 6)
+    Sur_Q_arr = np.round(np.asarray(pads["Sur_Q"][first_stale:], dtype=float), 6)
+
+    # --------------------------------------------------
+    # Solve the new pads in one call: continuous optimum,
+    # rounded geometry and bearing check (infeasible pads
+    # carry NaN)
+    # --------------------------------------------------
+    new_results = solve_pads_batch(
+        G=G_arr,
+        Q=Q_arr,
+        Sur_G=Sur_G_arr,
+        Sur_Q=Sur_Q_arr,
+        q_allow=q_allow,
+        q_target=q_target,
+        min_width=min_width,
+        rounding=rounding,
+        include_self_weight=include_self_weight,
+    )
+
+    # --------------------------------------------------
+    # Store results (appended to those still valid)
+    # --------------------------------------------------
+    if first_stale > 0:
+        new_results = {
+            key: np.concatenate((results[key], column))
+            for key, column in new_results.items()
+        }
+
+    results = new_results
+    st.session_state.pad_results = results
+    st.session_state.pad_results_sig = global_sig
+
+    # --------------------------------------------------
+    # Render each pad
+    # --------------------------------------------------
+    for i in range(n_pads):
+
+        pad_id = pads["id"][i]
+        st.subheader(f"Pad {pad_id}")
+
+        B_final = results["B_final"][i]
+
+        if np.isnan(B_final):
+            st.error("No feasible pad size found for this load case.")
+            continue
 
         st.metric("Pad size", f"{B_final:.2f} m × {B_final:.2f} m")
-        st.metric("Bearing pressure", f"{q_ed:.1f} kN/m²")
-        st.metric("Utilisation", f"{utilisation*100:.1f}%")
-        st.metric("Concrete volume", f"{volume:.2f} m³")
-        st.metric("Pad depth", f"{t_round:.2f} m")
+        st.metric("Bearing pressure", f"{results['q_ed'][i]:.1f} kN/m²")
+        st.metric("Utilisation", f"{results['utilisation'][i]*100:.1f}%")
+        st.metric("Concrete volume", f"{results['volume'][i]:.2f} m³")
+        st.metric("Pad depth", f"{results['t_round'][i]:.2f} m")
 
         st.success("Design OK")
 
-        with st.expander("Show calculation steps"):
-            st.markdown(pad["results"]["calc_md"])
+        # Expander bodies run on every rerun; a toggle skips the
+        # markdown build entirely while the steps are hidden
+        if st.toggle("Show calculation steps", key=f"calc_steps_{pad_id}"):
+            pad = {key: column[i] for key, column in pads.items()}
+            res = {key: column[i] for key, column in results.items()}
+            st.markdown(
+                calc_steps_md(pad, res, q_allow, target_utilisation, q_target)
+            )
 
         st.divider()
 
@@ -432,24 +629,29 @@ with st.expander("Show Assumptions"):
 with results_col:
     st.header("Summary of Pad Foundations")
 
-    if len(st.session_state.pads) == 0:
+    pads = st.session_state.pads
+    results = st.session_state.pad_results
+
+    if len(pads["id"]) == 0:
         st.info("No pad foundations added yet.")
     else:
-        import pandas as pd
-
-        summary_data = []
-        for pad in st.session_state.pads:
-            res = pad["results"]
-            summary_data.append(
-                {
-                    "Pad ID": pad["id"],
-                    "Width (m)": f"{res['B_final']:.2f}",
-                    "Depth (m)": f"{res['t_round']:.2f}",
-                    "Utilisation (%)": f"{res['utilisation']*100:.1f}",
-                    "SLS Load (kN)": f"{res['N_ck']:.1f}",
-                    "Volume (m³)": f"{res['volume']:.2f}",
-                }
+        feasible = ~np.isnan(results["B_final"])
+
+        summary_df = build_summary_df(
+            pad_ids=np.asarray(pads["id"])[feasible],
+            B_final=results["B_final"][feasible],
+            t_round=results["t_round"][feasible],
+            utilisation=results["utilisation"][feasible],
+            N_ck=results["N_ck"][feasible],
+            volume=results["volume"][feasible],
+        )
+        st.table(summary_df)
+
+        if st.button("📄 Prepare PDF summary"):
+            st.download_button(
+                "⬇️ Download PDF summary",
+                data=generate_pdf(summary_df),
+                file_name="pad_foundations.pdf",
+                mime="application/pdf",
             )
-
-        st.table(pd.DataFrame(summary_data))
    
\ No newline at end of file